@@ -7,7 +7,7 @@ Date: November 2025
 
 import sys
 from PyQt5.QtWidgets import QApplication
-from src.gui import TwoOptMainWindow
+from src.gui import TwoOptMainWindow, APP_STYLESHEET
 
 
 def main():
@@ -16,6 +16,7 @@ def main():
     
     app.setApplicationName("TSP 2-Opt Solver")
     app.setOrganizationName("University TSP Project")
+    app.setStyleSheet(APP_STYLESHEET)
     
     window = TwoOptMainWindow()
     window.show()
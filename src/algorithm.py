@@ -6,22 +6,469 @@ Implements local search heuristic with edge swap optimization
 import numpy as np
 import time
 import random
-from src.utilities import calculate_distance
+import threading
+from src.utilities import pairwise_distance_matrix
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    # Without numba the kernels below run as plain Python -- orders of
+    # magnitude slower, but the application stays fully functional on
+    # machines where the dependency cannot be installed
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(func):
+            return func
+        return wrap
+
+    prange = range
+
+# Candidate edges are restricted to each city's K nearest neighbors;
+# this keeps essentially all improving 2-opt moves while cutting the
+# per-sweep cost from O(n^2) to O(n*K)
+NEIGHBOR_K = 20
+
+# Minimum seconds between throttled progress callbacks (~30 Hz); keeps
+# Qt event posting out of the solver's critical path
+EMIT_INTERVAL = 0.033
+
+# Below this instance size the serial sweep wins; thread fork/join
+# overhead only pays off once each sweep has real work per core
+PARALLEL_MIN_N = 1000
+
+
+@njit(cache=True, fastmath=True)
+def _find_best_improvement(xs, ys, edge_len, neighbor_dists, tour, pos,
+                           neighbors, dont_look, n, eps):
+    """
+    Scan candidate edge pairs and return the best improving swap
+
+    A full sweep records the single most improving move instead of
+    restarting the scan at the first one found, so far fewer sweeps are
+    needed and each city is examined at most once per sweep.
+
+    Compiled with numba so the sweep runs as native code. Each tour
+    city b anchors a scan over its nearest neighbors y, trying the move
+    that replaces b's predecessor edge with (b, y) and the one that
+    replaces b's successor edge with (b, y); either variant is
+    normalized to a forward segment reversal whichever side of b the
+    candidate sits on (moves through the closing edge become reversals
+    that run to position n-1). Because the neighbor list is sorted by
+    distance,
+    the scan stops at the first candidate at least as long as both of
+    b's incident tour edges -- an improving move must make some city's
+    new edge shorter than a removed edge at that city, so nothing past
+    that point can qualify from b. Cities whose scan comes up empty get
+    their don't-look bit set and are skipped until an incident edge
+    changes.
+
+    The loop never touches the full n x n matrix: tour-edge lengths
+    come from the incrementally maintained edge_len array, candidate
+    edges from the (n, K) neighbor_dists table, and the one remaining
+    distance is recomputed from the coordinates. This keeps the
+    per-sweep working set at O(n*K) instead of O(n^2).
+
+    Args:
+        xs, ys: City coordinate arrays
+        edge_len: (n,) float32 lengths of current tour edges,
+            edge_len[i] == dist(tour[i], tour[i+1 mod n])
+        neighbor_dists: (n, K) float32 distances matching neighbors
+        tour: Current tour as int32 array
+        pos: Inverse of tour (pos[city] == tour position of city)
+        neighbors: (n, K) nearest-neighbor city ids, sorted by distance
+        dont_look: (n,) uint8 don't-look bits, updated in place
+        n: Number of cities
+        eps: Minimum absolute improvement for a swap to count; scaled
+            to the current tour length by the caller so float32
+            rounding noise never registers as progress
+
+    Returns:
+        Tuple (i, k, delta) of the best improving swap (reversing
+        tour[i:k+1]), or (-1, -1, 0.0) if no improvement exists
+    """
+    best_i = -1
+    best_k = -1
+    best_delta = -eps
+    num_cand = neighbors.shape[1]
+    for i in range(n):
+        b = tour[i]
+        if dont_look[b]:
+            continue
+        prev = i - 1 if i > 0 else n - 1
+        a = tour[prev]
+        d_ab = edge_len[prev]
+        succ_len = edge_len[i]
+        radius = d_ab if d_ab > succ_len else succ_len
+        found = False
+        for j in range(num_cand):
+            d_by = neighbor_dists[b, j]
+            if d_by >= radius:
+                # Sorted neighbors: every later candidate is at least
+                # as long as both edges the move could remove at b
+                break
+            y = neighbors[b, j]
+            p = pos[y]
+            # Replace the predecessor edge (a, b) with (b, y). When
+            # that edge is the closing edge (b at position 0) or the
+            # candidate is the start city (y at position 0), the move
+            # is the forward reversal running to the end of the tour
+            if d_by < d_ab:
+                if i == 0:
+                    if 0 < p < n - 1:
+                        w = tour[p - 1]
+                        e = tour[n - 1]
+                        dx = xs[w] - xs[e]
+                        dy = ys[w] - ys[e]
+                        delta = (np.sqrt(dx * dx + dy * dy) + d_by
+                                 - edge_len[p - 1] - d_ab)
+                        if delta < -eps:
+                            found = True
+                            if delta < best_delta:
+                                best_delta = delta
+                                best_i = p
+                                best_k = n - 1
+                elif p > i + 1:
+                    k = p - 1
+                    c = tour[k]
+                    dx = xs[a] - xs[c]
+                    dy = ys[a] - ys[c]
+                    delta = (np.sqrt(dx * dx + dy * dy) + d_by
+                             - d_ab - edge_len[k])
+                    if delta < -eps:
+                        found = True
+                        if delta < best_delta:
+                            best_delta = delta
+                            best_i = i
+                            best_k = k
+                elif p == 0:
+                    if i < n - 1:
+                        e = tour[n - 1]
+                        dx = xs[a] - xs[e]
+                        dy = ys[a] - ys[e]
+                        delta = (np.sqrt(dx * dx + dy * dy) + d_by
+                                 - d_ab - edge_len[n - 1])
+                        if delta < -eps:
+                            found = True
+                            if delta < best_delta:
+                                best_delta = delta
+                                best_i = i
+                                best_k = n - 1
+                elif p < i - 1:
+                    w = tour[p - 1]
+                    dx = xs[w] - xs[a]
+                    dy = ys[w] - ys[a]
+                    delta = (np.sqrt(dx * dx + dy * dy) + d_by
+                             - edge_len[p - 1] - d_ab)
+                    if delta < -eps:
+                        found = True
+                        if delta < best_delta:
+                            best_delta = delta
+                            best_i = p
+                            best_k = i - 1
+            # Replace the successor edge (b, tour[i+1]) with (b, y)
+            if d_by < succ_len:
+                if p > i + 1:
+                    sb = tour[i + 1]
+                    sy = tour[(p + 1) % n]
+                    dx = xs[sb] - xs[sy]
+                    dy = ys[sb] - ys[sy]
+                    delta = (d_by + np.sqrt(dx * dx + dy * dy)
+                             - succ_len - edge_len[p])
+                    if delta < -eps:
+                        found = True
+                        if delta < best_delta:
+                            best_delta = delta
+                            best_i = i + 1
+                            best_k = p
+                elif p < i - 1:
+                    sy = tour[p + 1]
+                    sb = tour[(i + 1) % n]
+                    dx = xs[sy] - xs[sb]
+                    dy = ys[sy] - ys[sb]
+                    delta = (d_by + np.sqrt(dx * dx + dy * dy)
+                             - edge_len[p] - succ_len)
+                    if delta < -eps:
+                        found = True
+                        if delta < best_delta:
+                            best_delta = delta
+                            best_i = p + 1
+                            best_k = i
+        if not found:
+            # No improving move starts at b until an incident edge
+            # changes
+            dont_look[b] = 1
+    if best_i < 0:
+        return -1, -1, 0.0
+    return best_i, best_k, best_delta
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _find_best_improvement_parallel(xs, ys, edge_len, neighbor_dists, tour,
+                                    pos, neighbors, dont_look, n, eps,
+                                    best_deltas, best_is, best_ks):
+    """
+    Parallel variant of _find_best_improvement for large instances
+
+    The per-city candidate scans are independent, so the i-range is
+    split across cores with prange; every thread writes only its own
+    per-i result slots and all shared inputs are read-only, so there is
+    no contention. A serial pass then reduces the per-i results to the
+    single best move. The per-i result arrays are caller-provided
+    scratch, reused across sweeps instead of reallocated per call.
+    """
+    best_ks[:] = -1
+    num_cand = neighbors.shape[1]
+    for i in prange(n):
+        b = tour[i]
+        if dont_look[b]:
+            continue
+        prev = i - 1 if i > 0 else n - 1
+        a = tour[prev]
+        d_ab = edge_len[prev]
+        succ_len = edge_len[i]
+        radius = d_ab if d_ab > succ_len else succ_len
+        local_delta = -eps
+        local_i = -1
+        local_k = -1
+        found = False
+        for j in range(num_cand):
+            d_by = neighbor_dists[b, j]
+            if d_by >= radius:
+                break
+            y = neighbors[b, j]
+            p = pos[y]
+            if d_by < d_ab:
+                if i == 0:
+                    if 0 < p < n - 1:
+                        w = tour[p - 1]
+                        e = tour[n - 1]
+                        dx = xs[w] - xs[e]
+                        dy = ys[w] - ys[e]
+                        delta = (np.sqrt(dx * dx + dy * dy) + d_by
+                                 - edge_len[p - 1] - d_ab)
+                        if delta < -eps:
+                            found = True
+                            if delta < local_delta:
+                                local_delta = delta
+                                local_i = p
+                                local_k = n - 1
+                elif p > i + 1:
+                    k = p - 1
+                    c = tour[k]
+                    dx = xs[a] - xs[c]
+                    dy = ys[a] - ys[c]
+                    delta = (np.sqrt(dx * dx + dy * dy) + d_by
+                             - d_ab - edge_len[k])
+                    if delta < -eps:
+                        found = True
+                        if delta < local_delta:
+                            local_delta = delta
+                            local_i = i
+                            local_k = k
+                elif p == 0:
+                    if i < n - 1:
+                        e = tour[n - 1]
+                        dx = xs[a] - xs[e]
+                        dy = ys[a] - ys[e]
+                        delta = (np.sqrt(dx * dx + dy * dy) + d_by
+                                 - d_ab - edge_len[n - 1])
+                        if delta < -eps:
+                            found = True
+                            if delta < local_delta:
+                                local_delta = delta
+                                local_i = i
+                                local_k = n - 1
+                elif p < i - 1:
+                    w = tour[p - 1]
+                    dx = xs[w] - xs[a]
+                    dy = ys[w] - ys[a]
+                    delta = (np.sqrt(dx * dx + dy * dy) + d_by
+                             - edge_len[p - 1] - d_ab)
+                    if delta < -eps:
+                        found = True
+                        if delta < local_delta:
+                            local_delta = delta
+                            local_i = p
+                            local_k = i - 1
+            if d_by < succ_len:
+                if p > i + 1:
+                    sb = tour[i + 1]
+                    sy = tour[(p + 1) % n]
+                    dx = xs[sb] - xs[sy]
+                    dy = ys[sb] - ys[sy]
+                    delta = (d_by + np.sqrt(dx * dx + dy * dy)
+                             - succ_len - edge_len[p])
+                    if delta < -eps:
+                        found = True
+                        if delta < local_delta:
+                            local_delta = delta
+                            local_i = i + 1
+                            local_k = p
+                elif p < i - 1:
+                    sy = tour[p + 1]
+                    sb = tour[(i + 1) % n]
+                    dx = xs[sy] - xs[sb]
+                    dy = ys[sy] - ys[sb]
+                    delta = (d_by + np.sqrt(dx * dx + dy * dy)
+                             - edge_len[p] - succ_len)
+                    if delta < -eps:
+                        found = True
+                        if delta < local_delta:
+                            local_delta = delta
+                            local_i = p + 1
+                            local_k = i
+        if not found:
+            dont_look[b] = 1
+        if local_k >= 0:
+            best_deltas[i] = local_delta
+            best_is[i] = local_i
+            best_ks[i] = local_k
+
+    best_i = -1
+    best_k = -1
+    best_delta = -eps
+    for i in range(n):
+        if best_ks[i] >= 0 and best_deltas[i] < best_delta:
+            best_delta = best_deltas[i]
+            best_i = best_is[i]
+            best_k = best_ks[i]
+    if best_i < 0:
+        return -1, -1, 0.0
+    return best_i, best_k, best_delta
+
+
+@njit(cache=True)
+def _apply_swap(tour, pos, edge_len, dont_look, i, k, d_ac, d_bd):
+    """
+    Apply the 2-opt move (i, k): reverse a segment and patch edge_len
+
+    The resulting cycle is the same whether tour[i:k+1] or its cyclic
+    complement is reversed, so whichever side is shorter is flipped --
+    capping the per-swap cost at n/2 element moves. Interior edges keep
+    their lengths in reversed order; only the two boundary edges are
+    replaced, by the precomputed new lengths. A reversal flips the
+    orientation of every city it moves, which changes the moves the
+    directed candidate scan can see from them, so their don't-look bits
+    are cleared along the way.
+    """
+    n = tour.shape[0]
+    inner = k - i + 1
+
+    if inner * 2 <= n:
+        lo = i
+        hi = k - 1
+        while lo < hi:
+            edge_len[lo], edge_len[hi] = edge_len[hi], edge_len[lo]
+            lo += 1
+            hi -= 1
+        edge_len[i - 1] = d_ac
+        edge_len[k] = d_bd
+        for p in range(i, k + 1):
+            dont_look[tour[p]] = 0
+        _reverse_segment(tour, pos, i, k)
+    else:
+        # Reverse the complement: cyclic positions k+1 .. i-1
+        outer = n - inner
+        p = k + 1
+        if p == n:
+            p = 0
+        for _ in range(outer):
+            dont_look[tour[p]] = 0
+            p += 1
+            if p == n:
+                p = 0
+        # tour[i] and tour[k] do not move on this path, but each gains
+        # a new incident edge, so they must be rescanned too
+        dont_look[tour[i]] = 0
+        dont_look[tour[k]] = 0
+
+        lo = k + 1
+        if lo == n:
+            lo = 0
+        hi = i - 1
+        for _ in range(outer // 2):
+            tour[lo], tour[hi] = tour[hi], tour[lo]
+            pos[tour[lo]] = lo
+            pos[tour[hi]] = hi
+            lo += 1
+            if lo == n:
+                lo = 0
+            hi -= 1
+            if hi < 0:
+                hi = n - 1
+
+        # Interior complement edges sit at cyclic positions k+1 .. i-2
+        lo = k + 1
+        if lo == n:
+            lo = 0
+        hi = i - 2
+        if hi < 0:
+            hi = n - 1
+        for _ in range((outer - 1) // 2):
+            edge_len[lo], edge_len[hi] = edge_len[hi], edge_len[lo]
+            lo += 1
+            if lo == n:
+                lo = 0
+            hi -= 1
+            if hi < 0:
+                hi = n - 1
+        edge_len[k] = d_ac
+        edge_len[i - 1] = d_bd
+
+
+@njit(cache=True)
+def _reverse_segment(tour, pos, i, k):
+    """
+    Reverse tour[i:k+1] in place with a two-pointer swap
+
+    Avoids the per-swap list slicing and concatenation of the naive
+    2-opt swap, so an accepted improvement costs no allocation. The pos
+    index is kept in sync with the reversed entries.
+    """
+    while i < k:
+        tour[i], tour[k] = tour[k], tour[i]
+        pos[tour[i]] = i
+        pos[tour[k]] = k
+        i += 1
+        k -= 1
 
 
 class TwoOptTSP:
     """2-Opt solver for Traveling Salesman Problem"""
     
-    def __init__(self, cities):
+    def __init__(self, names, coords, distance_matrix=None):
         """
         Initialize TSP solver with cities
         
         Args:
-            cities: List of tuples (name, x, y)
+            names: List of city names (display only)
+            coords: (n, 2) array of city coordinates
+            distance_matrix: Optional precomputed (n, n) distance
+                matrix for these cities; computed here when omitted
         """
-        self.cities = cities
-        self.n = len(cities)
-        self.distance_matrix = self.create_distance_matrix()
+        self.n = len(names)
+        # Structure-of-arrays layout: names stay a Python list, the
+        # coordinates live in contiguous float32 arrays -- matching the
+        # float32 distance matrix, so the kernels stream half the bytes
+        # and never mix precisions mid-expression
+        self.names = list(names)
+        self.coords = np.asarray(coords, dtype=np.float32)
+        self.xs = np.ascontiguousarray(self.coords[:, 0])
+        self.ys = np.ascontiguousarray(self.coords[:, 1])
+        if distance_matrix is not None:
+            self.distance_matrix = distance_matrix
+        else:
+            self.distance_matrix = self.create_distance_matrix()
+        self.neighbors = self.create_neighbor_lists()
+        # Compact candidate-edge lengths so the hot loop stays out of
+        # the full matrix
+        self.neighbor_dists = np.take_along_axis(self.distance_matrix,
+                                                 self.neighbors, axis=1)
         self.best_tour = None
         self.best_distance = float('inf')
         
@@ -37,6 +484,7 @@ class TwoOptTSP:
         # Visualization
         self.callback = None
         self.visualization_delay = 0.1
+        self._last_emit = 0.0
     
     def set_progress_callback(self, callback):
         """Set callback function for progress updates"""
@@ -44,41 +492,59 @@ class TwoOptTSP:
     
     def create_distance_matrix(self):
         """Create distance matrix from city coordinates"""
-        n = len(self.cities)
-        matrix = np.zeros((n, n))
-        
-        for i in range(n):
-            for j in range(n):
-                if i != j:
-                    matrix[i][j] = calculate_distance(
-                        self.cities[i][1], self.cities[i][2],
-                        self.cities[j][1], self.cities[j][2]
-                    )
-                else:
-                    matrix[i][j] = 0
-        
-        return matrix
+        # float32 halves the bytes per lookup in the 2-opt inner loop,
+        # which is bound by matrix reads; precision is ample for tour
+        # comparison
+        return pairwise_distance_matrix(self.coords)
+    
+    def create_neighbor_lists(self):
+        """Create per-city nearest-neighbor candidate lists"""
+        k = min(NEIGHBOR_K, self.n - 1)
+        # argpartition pulls the k+1 smallest entries per row in O(n)
+        # instead of fully sorting each row; only that small block is
+        # then argsorted so candidates stay ordered by distance. The
+        # leading column is the city itself (distance 0)
+        part = np.argpartition(self.distance_matrix, k, axis=1)[:, :k + 1]
+        part_dists = np.take_along_axis(self.distance_matrix, part, axis=1)
+        order = np.argsort(part_dists, axis=1)
+        return np.take_along_axis(part, order, axis=1)[:, 1:].astype(np.int32)
     
     def calculate_tour_distance(self, tour):
-        """Calculate total distance of a tour"""
-        distance = 0
-        for i in range(len(tour)):
-            distance += self.distance_matrix[tour[i]][tour[(i + 1) % len(tour)]]
-        return distance
+        """Calculate total distance of a tour (float64 accumulation)"""
+        t = np.asarray(tour)
+        edges = self.distance_matrix[t, np.roll(t, -1)]
+        return float(edges.sum(dtype=np.float64))
     
     def create_initial_tour_nearest_neighbor(self):
-        """Create initial tour using nearest neighbor heuristic"""
-        unvisited = set(range(1, self.n))
+        """
+        Create initial tour using nearest neighbor heuristic
+
+        Returns:
+            Tuple of (tour, total_distance); the tour length is
+            accumulated during construction so solve() does not need a
+            second pass over the edges
+        """
+        visited = np.zeros(self.n, dtype=bool)
+        visited[0] = True
         tour = [0]  # Start at city 0
-        
+        total = 0.0
+
         current = 0
-        while unvisited:
-            nearest = min(unvisited, key=lambda city: self.distance_matrix[current][city])
+        for _ in range(self.n - 1):
+            # Mask out visited cities and let argmin scan the row at
+            # C speed instead of a Python min over a shrinking set
+            row = self.distance_matrix[current].copy()
+            row[visited] = np.inf
+            nearest = int(row.argmin())
+            total += float(row[nearest])
             tour.append(nearest)
-            unvisited.remove(nearest)
+            visited[nearest] = True
             current = nearest
-        
-        return tour
+
+        # Closing edge back to the start city
+        total += float(self.distance_matrix[current][0])
+
+        return tour, total
     
     def create_initial_tour_random(self):
         """Create random initial tour"""
@@ -86,24 +552,12 @@ class TwoOptTSP:
         random.shuffle(tour[1:])  # Keep first city fixed
         return tour
     
-    def two_opt_swap(self, tour, i, k):
-        """
-        Perform 2-opt swap: reverse tour segment between i and k
-        
-        Args:
-            tour: Current tour
-            i, k: Indices for swap
-            
-        Returns:
-            New tour after swap
-        """
-        new_tour = tour[:i] + tour[i:k+1][::-1] + tour[k+1:]
-        return new_tour
-    
     def calculate_swap_delta(self, tour, i, k):
         """
-        Calculate change in distance if swap is performed
-        Faster than recalculating entire tour
+        Calculate change in distance if the swap (i, k) were performed
+
+        The O(1) four-term delta -- the same formula the compiled
+        kernels evaluate -- rather than a full tour recomputation.
         """
         n = len(tour)
         
@@ -130,98 +584,171 @@ class TwoOptTSP:
             Tuple of (best_tour, best_distance)
         """
         self.start_time = time.time()
-        
+
+        # Bind hot attributes to locals once: attribute lookups inside
+        # the swap loop would otherwise pay a dict lookup per access
+        n = self.n
+        D = self.distance_matrix
+        cb = self.callback
+        delay = self.visualization_delay
+
         # Create initial tour
         if initial_method == 'nearest_neighbor':
-            tour = self.create_initial_tour_nearest_neighbor()
+            tour, current_distance = self.create_initial_tour_nearest_neighbor()
         else:
             tour = self.create_initial_tour_random()
+            current_distance = self.calculate_tour_distance(tour)
+        # int32 is ample for any instance this tool will see and
+        # halves the bytes the kernels stream through tour/pos/neighbors
+        tour = np.asarray(tour, dtype=np.int32)
+        pos = np.empty(n, dtype=np.int32)
+        pos[tour] = np.arange(n)
         
-        current_distance = self.calculate_tour_distance(tour)
-        self.best_tour = tour.copy()
+        self.best_tour = tour
         self.best_distance = current_distance
         self.distance_history.append(current_distance)
         
         # Notify initial state
-        if self.callback:
-            self.callback({
+        if cb:
+            cb({
                 'iteration': 0,
-                'tour': tour,
+                'tour': list(tour),
                 'distance': current_distance,
                 'swaps_made': 0,
                 'improvements': 0,
                 'phase': 'initial'
             })
-            time.sleep(self.visualization_delay)
+            time.sleep(delay)
         
-        # 2-Opt improvement loop
+        # 2-Opt improvement loop. The sweep always runs in compiled
+        # code; callbacks fire between swaps, never inside the
+        # candidate scan. With a visualization delay the solver runs in
+        # educational step mode (one callback per swap); otherwise
+        # progress snapshots are throttled to ~30 Hz
         improved = True
-        self.iterations = 0
-        
+        iterations = 0
+        swaps_made = self.swaps_made
+        improvements = self.improvements
+        history_append = self.distance_history.append
+        step_mode = cb is not None and delay > 0
+        dont_look = np.zeros(n, dtype=np.uint8)
+        edge_len = D[tour, np.roll(tour, -1)]
+        xs, ys = self.xs, self.ys
+        neighbors = self.neighbors
+        neighbor_dists = self.neighbor_dists
+
+        parallel = n >= PARALLEL_MIN_N
+        if parallel:
+            # Scratch for the parallel kernel's per-i results, reused
+            # across sweeps
+            scratch_deltas = np.zeros(n, dtype=np.float64)
+            scratch_is = np.empty(n, dtype=np.int64)
+            scratch_ks = np.empty(n, dtype=np.int64)
+
+        def run_sweep(eps):
+            if parallel:
+                return _find_best_improvement_parallel(
+                    xs, ys, edge_len, neighbor_dists,
+                    tour, pos, neighbors, dont_look, n, eps,
+                    scratch_deltas, scratch_is, scratch_ks
+                )
+            return _find_best_improvement(
+                xs, ys, edge_len, neighbor_dists,
+                tour, pos, neighbors, dont_look, n, eps
+            )
+
         while improved:
-            improved = False
-            self.iterations += 1
-            
-            # Try all possible edge swaps
-            for i in range(1, self.n - 1):
-                for k in range(i + 1, self.n):
-                    # Visualize considering this swap
-                    if self.callback:
-                        self.callback({
-                            'iteration': self.iterations,
-                            'tour': tour,
+            iterations += 1
+            # Relative threshold: an improvement must beat rounding
+            # noise in the float32 running sum to count as progress
+            eps = 1e-6 * current_distance
+            i, k, delta = run_sweep(eps)
+            if i < 0 and dont_look.any():
+                # Don't-look bits are a heuristic filter: a distant
+                # swap can turn a sleeping city's move improving
+                # without touching that city's own edges. Verify the
+                # apparent optimum with one unfiltered sweep before
+                # declaring convergence
+                dont_look[:] = 0
+                i, k, delta = run_sweep(eps)
+            improved = i >= 0
+
+            if improved:
+                if step_mode:
+                    # Show the move being considered before applying it.
+                    # The tour has not changed since the last update, so
+                    # no tour copy is shipped with this phase
+                    cb({
+                        'iteration': iterations,
+                        'distance': current_distance,
+                        'swaps_made': swaps_made,
+                        'improvements': improvements,
+                        'considering_swap': (i, k),
+                        'phase': 'searching'
+                    })
+                    time.sleep(delay * 0.5)
+
+                a, b = tour[i - 1], tour[i]
+                c, d = tour[k], tour[(k + 1) % n]
+                # The endpoints of the two new edges may have improving
+                # moves again (segment cities are cleared in the swap)
+                dont_look[a] = 0
+                dont_look[d] = 0
+                _apply_swap(tour, pos, edge_len, dont_look, i, k,
+                            D[a, c], D[b, d])
+                current_distance += delta
+                swaps_made += 1
+                improvements += 1
+                history_append(current_distance)
+
+                if step_mode:
+                    cb({
+                        'iteration': iterations,
+                        'tour': list(tour),
+                        'distance': current_distance,
+                        'swaps_made': swaps_made,
+                        'improvements': improvements,
+                        'swap_performed': (i, k),
+                        'improvement': -delta,
+                        'phase': 'swap'
+                    })
+                    time.sleep(delay)
+                elif cb:
+                    now = time.monotonic()
+                    if now - self._last_emit > EMIT_INTERVAL:
+                        self._last_emit = now
+                        cb({
+                            'iteration': iterations,
+                            'tour': list(tour),
                             'distance': current_distance,
-                            'swaps_made': self.swaps_made,
-                            'improvements': self.improvements,
-                            'considering_swap': (i, k),
-                            'phase': 'searching'
+                            'swaps_made': swaps_made,
+                            'improvements': improvements,
+                            'swap_performed': (i, k),
+                            'improvement': -delta,
+                            'phase': 'swap'
                         })
-                        time.sleep(self.visualization_delay * 0.5)
-                    
-                    # Calculate improvement
-                    delta = self.calculate_swap_delta(tour, i, k)
-                    
-                    if delta < -0.001:  # Improvement found (with small epsilon)
-                        # Perform swap
-                        tour = self.two_opt_swap(tour, i, k)
-                        current_distance += delta
-                        self.swaps_made += 1
-                        self.improvements += 1
-                        improved = True
-                        
-                        # Update best if needed
-                        if current_distance < self.best_distance:
-                            self.best_tour = tour.copy()
-                            self.best_distance = current_distance
-                            self.distance_history.append(current_distance)
-                        
-                        # Visualize swap
-                        if self.callback:
-                            self.callback({
-                                'iteration': self.iterations,
-                                'tour': tour,
-                                'distance': current_distance,
-                                'swaps_made': self.swaps_made,
-                                'improvements': self.improvements,
-                                'swap_performed': (i, k),
-                                'improvement': -delta,
-                                'phase': 'swap'
-                            })
-                            time.sleep(self.visualization_delay)
-                        
-                        break  # Restart with new tour
-                
-                if improved:
-                    break
-        
+
+        # Write the loop-local counters back for get_statistics
+        self.iterations = iterations
+        self.swaps_made = swaps_made
+        self.improvements = improvements
+
+        # 2-opt only ever accepts strict improvements, so the final
+        # tour is the best tour -- no per-swap copy needed. Reconcile
+        # the running float32 delta sum against a fresh float64
+        # recomputation so accumulated drift never leaks into the
+        # reported result
+        self.best_tour = tour
+        self.best_distance = self.calculate_tour_distance(tour)
+
         # Final result
         self.end_time = time.time()
         self.computation_time = self.end_time - self.start_time
         
-        if self.callback:
-            self.callback({
+        if cb:
+            cb({
                 'iteration': self.iterations,
-                'tour': self.best_tour,
+                'tour': list(self.best_tour),
                 'distance': self.best_distance,
                 'swaps_made': self.swaps_made,
                 'improvements': self.improvements,
@@ -242,4 +769,32 @@ class TwoOptTSP:
             'improvement_percent': ((self.distance_history[0] - self.best_distance) / 
                                    self.distance_history[0] * 100) if self.distance_history else 0,
             'distance_history': self.distance_history
-        }
\ No newline at end of file
+        }
+
+def _warmup_kernels():
+    """Trigger numba compilation on a tiny throwaway instance"""
+    # float32 to match the arrays solve() passes -- warming any other
+    # dtype would compile a specialization that is never called
+    xs = np.array([0.0, 3.0, 3.0, 0.0, 1.0], dtype=np.float32)
+    ys = np.array([0.0, 0.0, 3.0, 3.0, 1.0], dtype=np.float32)
+    tour = np.arange(5, dtype=np.int32)
+    pos = np.arange(5, dtype=np.int32)
+    edge_len = np.ones(5, dtype=np.float32)
+    neighbor_dists = np.ones((5, 2), dtype=np.float32)
+    neighbors = np.zeros((5, 2), dtype=np.int32)
+    dont_look = np.zeros(5, dtype=np.uint8)
+    # The parallel kernel is deliberately left to compile on first use:
+    # running a parallel=True function from a short-lived helper thread
+    # leaves numba's threading layer unable to shut down cleanly
+    _find_best_improvement(xs, ys, edge_len, neighbor_dists, tour, pos,
+                           neighbors, dont_look, 5, 1e-6)
+    _apply_swap(tour, pos, edge_len, dont_look, 1, 3,
+                np.float32(1.0), np.float32(1.0))
+
+
+if NUMBA_AVAILABLE:
+    # Compile (or load the on-disk cache of) the kernels off the main
+    # thread so GUI startup and the first Start click are not stalled
+    # by jit compilation
+    threading.Thread(target=_warmup_kernels, daemon=True,
+                     name="tsp-jit-warmup").start()
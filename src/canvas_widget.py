@@ -5,8 +5,9 @@ Shows edge swaps and tour improvements
 
 from PyQt5.QtWidgets import QWidget
 from PyQt5.QtCore import Qt, QPointF, QRectF
-from PyQt5.QtGui import QPainter, QPen, QBrush, QColor, QFont
+from PyQt5.QtGui import QPainter, QPen, QBrush, QColor, QFont, QPolygonF
 import math
+import numpy as np
 
 
 class TwoOptCanvas(QWidget):
@@ -17,19 +18,29 @@ class TwoOptCanvas(QWidget):
         self.setMinimumSize(600, 500)
         self.setStyleSheet("background-color: white; border: 2px solid #e0e0e0; border-radius: 8px;")
         
-        # Data
-        self.cities = []
+        # Data (structure-of-arrays: names list + coordinate arrays)
+        self.names = []
+        self.xs = np.empty(0, dtype=np.float64)
+        self.ys = np.empty(0, dtype=np.float64)
         self.current_tour = None
-        self.scaled_cities = []
+        self.scaled_xs = np.empty(0, dtype=np.float64)
+        self.scaled_ys = np.empty(0, dtype=np.float64)
+        self._scaled_dirty = True
+        self._tour_polygon = None
         
         # Visualization state
         self.considering_swap = None  # (i, k) indices being considered
         self.swap_performed = None  # Recently performed swap
         self.swap_highlight_counter = 0
     
-    def set_cities(self, cities):
+    def set_cities(self, names, coords):
         """Set cities to display"""
-        self.cities = cities
+        coords = np.asarray(coords, dtype=np.float64).reshape(len(names), 2)
+        self.names = list(names)
+        self.xs = np.ascontiguousarray(coords[:, 0])
+        self.ys = np.ascontiguousarray(coords[:, 1])
+        self._scaled_dirty = True
+        self._tour_polygon = None
         self.current_tour = None
         self.considering_swap = None
         self.swap_performed = None
@@ -38,6 +49,7 @@ class TwoOptCanvas(QWidget):
     def set_tour(self, tour):
         """Set current tour"""
         self.current_tour = tour
+        self._tour_polygon = None
         self.update()
     
     def set_considering_swap(self, swap_indices):
@@ -54,44 +66,49 @@ class TwoOptCanvas(QWidget):
     def clear_visualization(self):
         """Clear all visualization"""
         self.current_tour = None
+        self._tour_polygon = None
         self.considering_swap = None
         self.swap_performed = None
         self.update()
     
+    def resizeEvent(self, event):
+        """Invalidate cached scaled coordinates on resize"""
+        self._scaled_dirty = True
+        self._tour_polygon = None
+        super().resizeEvent(event)
+
     def scale_coordinates(self):
         """Scale city coordinates to canvas"""
-        if not self.cities:
+        if not self.names:
             return
         
         width = self.width()
         height = self.height()
         padding = 60
         
-        x_coords = [city[1] for city in self.cities]
-        y_coords = [city[2] for city in self.cities]
-        
-        x_min, x_max = min(x_coords), max(x_coords)
-        y_min, y_max = min(y_coords), max(y_coords)
+        x_min, x_max = self.xs.min(), self.xs.max()
+        y_min, y_max = self.ys.min(), self.ys.max()
         
         x_range = x_max - x_min if x_max != x_min else 1
         y_range = y_max - y_min if y_max != y_min else 1
         
-        self.scaled_cities = []
-        for name, x, y in self.cities:
-            canvas_x = padding + ((x - x_min) / x_range) * (width - 2 * padding)
-            canvas_y = padding + ((y - y_min) / y_range) * (height - 2 * padding)
-            self.scaled_cities.append((name, canvas_x, canvas_y))
+        self.scaled_xs = padding + ((self.xs - x_min) / x_range) * (width - 2 * padding)
+        self.scaled_ys = padding + ((self.ys - y_min) / y_range) * (height - 2 * padding)
     
     def paintEvent(self, event):
         """Paint the canvas"""
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
         
-        if not self.cities:
+        if not self.names:
             self.draw_empty_state(painter)
             return
         
-        self.scale_coordinates()
+        # Rescale only when the city set or the widget size changed,
+        # not on every animation frame
+        if self._scaled_dirty:
+            self.scale_coordinates()
+            self._scaled_dirty = False
         
         # Draw current tour
         if self.current_tour and len(self.current_tour) > 1:
@@ -117,7 +134,8 @@ class TwoOptCanvas(QWidget):
     
     def draw_cities(self, painter):
         """Draw city markers"""
-        for i, (name, x, y) in enumerate(self.scaled_cities):
+        for i, name in enumerate(self.names):
+            x, y = self.scaled_xs[i], self.scaled_ys[i]
             # Start city in green
             if i == 0:
                 color = QColor("#4CAF50")
@@ -145,19 +163,18 @@ class TwoOptCanvas(QWidget):
         if not self.current_tour or len(self.current_tour) < 2:
             return
         
-        # Draw all edges in blue
-        painter.setPen(QPen(QColor("#2196F3"), 2, Qt.SolidLine))
+        # One batched polyline instead of one Qt call per edge; the
+        # polygon is cached until the tour or the scaling changes
+        if self._tour_polygon is None:
+            n = len(self.names)
+            points = [QPointF(self.scaled_xs[idx], self.scaled_ys[idx])
+                      for idx in self.current_tour if idx < n]
+            if points:
+                points.append(points[0])  # Close the cycle
+            self._tour_polygon = QPolygonF(points)
         
-        for i in range(len(self.current_tour)):
-            idx1 = self.current_tour[i]
-            idx2 = self.current_tour[(i + 1) % len(self.current_tour)]
-            
-            if idx1 < len(self.scaled_cities) and idx2 < len(self.scaled_cities):
-                city1 = self.scaled_cities[idx1]
-                city2 = self.scaled_cities[idx2]
-                
-                painter.drawLine(QPointF(city1[1], city1[2]), 
-                               QPointF(city2[1], city2[2]))
+        painter.setPen(QPen(QColor("#2196F3"), 2, Qt.SolidLine))
+        painter.drawPolyline(self._tour_polygon)
     
     def draw_considering_swap(self, painter):
         """Highlight edges being considered for swap"""
@@ -176,31 +193,27 @@ class TwoOptCanvas(QWidget):
         painter.setPen(QPen(QColor("#F44336"), 3, Qt.DashLine))
         
         # Draw first edge to remove
-        if edge1_start < len(self.scaled_cities) and edge1_end < len(self.scaled_cities):
-            c1 = self.scaled_cities[edge1_start]
-            c2 = self.scaled_cities[edge1_end]
-            painter.drawLine(QPointF(c1[1], c1[2]), QPointF(c2[1], c2[2]))
+        if edge1_start < len(self.names) and edge1_end < len(self.names):
+            painter.drawLine(QPointF(self.scaled_xs[edge1_start], self.scaled_ys[edge1_start]),
+                             QPointF(self.scaled_xs[edge1_end], self.scaled_ys[edge1_end]))
         
         # Draw second edge to remove
-        if edge2_start < len(self.scaled_cities) and edge2_end < len(self.scaled_cities):
-            c1 = self.scaled_cities[edge2_start]
-            c2 = self.scaled_cities[edge2_end]
-            painter.drawLine(QPointF(c1[1], c1[2]), QPointF(c2[1], c2[2]))
+        if edge2_start < len(self.names) and edge2_end < len(self.names):
+            painter.drawLine(QPointF(self.scaled_xs[edge2_start], self.scaled_ys[edge2_start]),
+                             QPointF(self.scaled_xs[edge2_end], self.scaled_ys[edge2_end]))
         
         # Edges that would be added (green dashed)
         painter.setPen(QPen(QColor("#4CAF50"), 3, Qt.DashLine))
         
         # New edge 1
-        if edge1_start < len(self.scaled_cities) and edge2_start < len(self.scaled_cities):
-            c1 = self.scaled_cities[edge1_start]
-            c2 = self.scaled_cities[edge2_start]
-            painter.drawLine(QPointF(c1[1], c1[2]), QPointF(c2[1], c2[2]))
+        if edge1_start < len(self.names) and edge2_start < len(self.names):
+            painter.drawLine(QPointF(self.scaled_xs[edge1_start], self.scaled_ys[edge1_start]),
+                             QPointF(self.scaled_xs[edge2_start], self.scaled_ys[edge2_start]))
         
         # New edge 2
-        if edge1_end < len(self.scaled_cities) and edge2_end < len(self.scaled_cities):
-            c1 = self.scaled_cities[edge1_end]
-            c2 = self.scaled_cities[edge2_end]
-            painter.drawLine(QPointF(c1[1], c1[2]), QPointF(c2[1], c2[2]))
+        if edge1_end < len(self.names) and edge2_end < len(self.names):
+            painter.drawLine(QPointF(self.scaled_xs[edge1_end], self.scaled_ys[edge1_end]),
+                             QPointF(self.scaled_xs[edge2_end], self.scaled_ys[edge2_end]))
     
     def draw_swap_performed(self, painter):
         """Highlight swap that was just performed"""
@@ -221,12 +234,10 @@ class TwoOptCanvas(QWidget):
         painter.setPen(QPen(QColor(76, 175, 80, alpha), 5, Qt.SolidLine))
         
         # Draw new edges
-        if edge1_start < len(self.scaled_cities) and edge2_start < len(self.scaled_cities):
-            c1 = self.scaled_cities[edge1_start]
-            c2 = self.scaled_cities[edge2_start]
-            painter.drawLine(QPointF(c1[1], c1[2]), QPointF(c2[1], c2[2]))
-        
-        if edge1_end < len(self.scaled_cities) and edge2_end < len(self.scaled_cities):
-            c1 = self.scaled_cities[edge1_end]
-            c2 = self.scaled_cities[edge2_end]
-            painter.drawLine(QPointF(c1[1], c1[2]), QPointF(c2[1], c2[2]))
\ No newline at end of file
+        if edge1_start < len(self.names) and edge2_start < len(self.names):
+            painter.drawLine(QPointF(self.scaled_xs[edge1_start], self.scaled_ys[edge1_start]),
+                             QPointF(self.scaled_xs[edge2_start], self.scaled_ys[edge2_start]))
+        
+        if edge1_end < len(self.names) and edge2_end < len(self.names):
+            painter.drawLine(QPointF(self.scaled_xs[edge1_end], self.scaled_ys[edge1_end]),
+                             QPointF(self.scaled_xs[edge2_end], self.scaled_ys[edge2_end]))
\ No newline at end of file
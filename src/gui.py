@@ -7,46 +7,128 @@ from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                              QPushButton, QLabel, QLineEdit, QListWidget, 
                              QGroupBox, QGridLayout, QMessageBox, QProgressBar,
                              QSplitter, QFrame, QComboBox)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
+from PyQt5.QtCore import Qt, QThread, QTimer, pyqtSignal
 from PyQt5.QtGui import QFont
 import sys
 
+import numpy as np
+
 from src.algorithm import TwoOptTSP
 from src.canvas_widget import TwoOptCanvas
+from src.utilities import pairwise_distance_matrix
+
+
+# Application-wide stylesheet; installed once on the QApplication in
+# main() so Qt resolves styles from a single shared cache instead of
+# re-walking a per-window stylesheet on every widget text change
+APP_STYLESHEET = """
+    QMainWindow {
+        background-color: #f5f5f5;
+    }
+    QGroupBox {
+        font-weight: bold;
+        border: 2px solid #cccccc;
+        border-radius: 8px;
+        margin-top: 10px;
+        padding-top: 10px;
+        background-color: white;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px;
+    }
+    QPushButton {
+        background-color: #FF9800;
+        color: white;
+        border: none;
+        border-radius: 5px;
+        padding: 8px;
+        font-weight: bold;
+        font-size: 11px;
+    }
+    QPushButton:hover {
+        background-color: #F57C00;
+    }
+    QPushButton:pressed {
+        background-color: #E65100;
+    }
+    QPushButton:disabled {
+        background-color: #BDBDBD;
+    }
+    QLineEdit {
+        border: 2px solid #e0e0e0;
+        border-radius: 5px;
+        padding: 5px;
+        background-color: white;
+    }
+    QLineEdit:focus {
+        border: 2px solid #FF9800;
+    }
+    QListWidget {
+        border: 2px solid #e0e0e0;
+        border-radius: 5px;
+        background-color: white;
+    }
+    QProgressBar {
+        border: 2px solid #e0e0e0;
+        border-radius: 5px;
+        text-align: center;
+    }
+    QProgressBar::chunk {
+        background-color: #FF9800;
+    }
+    QComboBox {
+        border: 2px solid #e0e0e0;
+        border-radius: 5px;
+        padding: 5px;
+        background-color: white;
+    }
+"""
 
 
 class SolverThread(QThread):
     """Background thread for running 2-Opt solver"""
     
-    progress_update = pyqtSignal(dict)
     solution_found = pyqtSignal(list, float)
     error_occurred = pyqtSignal(str)
     
-    def __init__(self, cities, initial_method='nearest_neighbor'):
+    def __init__(self, names, coords, initial_method='nearest_neighbor',
+                 distance_matrix=None):
         super().__init__()
-        self.cities = cities
+        self.names = names
+        self.coords = coords
         self.initial_method = initial_method
+        self.distance_matrix = distance_matrix
         self.solver = None
         self.should_stop = False
-        
+        # Latest progress snapshot, sampled by the GUI poll timer.
+        # Replacing the reference is atomic under the GIL, so no lock
+        # is needed on either side
+        self.latest_stats = None
+
     def run(self):
         """Execute solving in background"""
         try:
-            self.solver = TwoOptTSP(self.cities)
+            self.solver = TwoOptTSP(self.names, self.coords,
+                                    self.distance_matrix)
             self.solver.set_progress_callback(self.on_progress)
             
             tour, distance = self.solver.solve(self.initial_method)
-            
+
             if not self.should_stop:
-                self.solution_found.emit(tour, distance)
+                self.solution_found.emit(list(tour), distance)
                 
         except Exception as e:
             self.error_occurred.emit(str(e))
     
     def on_progress(self, stats):
-        """Handle progress updates"""
-        if not self.should_stop:
-            self.progress_update.emit(stats)
+        """Publish the latest progress snapshot for the GUI to sample"""
+        # No signal per update: queued pyqtSignal(dict) emissions pile
+        # up in Qt's event queue far faster than the GUI can drain
+        # them. The solver just overwrites the snapshot slot; the main
+        # thread reads it at its own pace
+        self.latest_stats = stats
     
     def stop(self):
         """Stop solver"""
@@ -61,15 +143,33 @@ class TwoOptMainWindow(QMainWindow):
         self.setWindowTitle("TSP 2-Opt Solver - Local Search Optimization")
         self.setGeometry(100, 100, 1400, 800)
         
-        # Data
-        self.cities = []
+        # Data (structure-of-arrays: names are display-only, the
+        # solver and canvas only need the coordinate array)
+        self.city_names = []
+        self.city_coords = np.empty((0, 2), dtype=np.float64)
+        # Display labels formatted once per city; rebuilds of the list
+        # widget never re-run float formatting
+        self.city_labels = []
+        # Mirror of city_names for O(1) duplicate checks
+        self.city_name_set = set()
         self.solution = None
         self.total_distance = 0
         self.solver_thread = None
+        self._dist_cache = {}
+
+        # Samples the solver's latest progress snapshot at ~60 Hz;
+        # started for the duration of a solve
+        self._poll_timer = QTimer(self)
+        self._poll_timer.setInterval(16)
+        self._poll_timer.timeout.connect(self.poll_progress)
+        self._last_stats = None
+
+        # Coalesces canvas city updates: any number of mutations in
+        # one event-loop iteration cost a single set_cities/repaint
+        self._canvas_refresh_scheduled = False
         
         # Setup UI
         self.init_ui()
-        self.apply_styles()
         
     def init_ui(self):
         """Initialize user interface"""
@@ -260,73 +360,6 @@ class TwoOptMainWindow(QMainWindow):
         
         return panel
     
-    def apply_styles(self):
-        """Apply styling"""
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #f5f5f5;
-            }
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #cccccc;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 10px;
-                background-color: white;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-            QPushButton {
-                background-color: #FF9800;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 8px;
-                font-weight: bold;
-                font-size: 11px;
-            }
-            QPushButton:hover {
-                background-color: #F57C00;
-            }
-            QPushButton:pressed {
-                background-color: #E65100;
-            }
-            QPushButton:disabled {
-                background-color: #BDBDBD;
-            }
-            QLineEdit {
-                border: 2px solid #e0e0e0;
-                border-radius: 5px;
-                padding: 5px;
-                background-color: white;
-            }
-            QLineEdit:focus {
-                border: 2px solid #FF9800;
-            }
-            QListWidget {
-                border: 2px solid #e0e0e0;
-                border-radius: 5px;
-                background-color: white;
-            }
-            QProgressBar {
-                border: 2px solid #e0e0e0;
-                border-radius: 5px;
-                text-align: center;
-            }
-            QProgressBar::chunk {
-                background-color: #FF9800;
-            }
-            QComboBox {
-                border: 2px solid #e0e0e0;
-                border-radius: 5px;
-                padding: 5px;
-                background-color: white;
-            }
-        """)
-    
     def add_city(self):
         """Add city to list"""
         try:
@@ -338,20 +371,24 @@ class TwoOptMainWindow(QMainWindow):
                 QMessageBox.warning(self, "Invalid Input", "Please enter a city name")
                 return
             
-            if any(city[0] == name for city in self.cities):
+            if name in self.city_name_set:
                 QMessageBox.warning(self, "Duplicate", f"City '{name}' already exists")
                 return
             
-            self.cities.append((name, x, y))
-            self.cities_list.addItem(f"{name} ({x:.1f}, {y:.1f})")
+            self.city_names.append(name)
+            self.city_name_set.add(name)
+            self.city_coords = np.vstack([self.city_coords, [x, y]])
+            label = f"{name} ({x:.1f}, {y:.1f})"
+            self.city_labels.append(label)
+            self.cities_list.addItem(label)
             
             self.city_name_input.clear()
             self.x_coord_input.clear()
             self.y_coord_input.clear()
             self.city_name_input.setFocus()
             
-            self.canvas.set_cities(self.cities)
-            self.status_label.setText(f"Status: {len(self.cities)} cities added")
+            self.schedule_canvas_refresh()
+            self.status_label.setText(f"Status: {len(self.city_names)} cities added")
             
         except ValueError:
             QMessageBox.critical(self, "Invalid Input", 
@@ -361,35 +398,58 @@ class TwoOptMainWindow(QMainWindow):
         """Remove selected city"""
         current_row = self.cities_list.currentRow()
         if current_row >= 0:
-            self.cities.pop(current_row)
+            self.city_name_set.discard(self.city_names[current_row])
+            self.city_names.pop(current_row)
+            self.city_labels.pop(current_row)
+            self.city_coords = np.delete(self.city_coords, current_row, 0)
             self.cities_list.takeItem(current_row)
-            self.canvas.set_cities(self.cities)
-            self.status_label.setText(f"Status: {len(self.cities)} cities added")
+            self.schedule_canvas_refresh()
+            self.status_label.setText(f"Status: {len(self.city_names)} cities added")
     
     def load_sample_cities(self):
         """Load sample cities"""
-        sample_cities = [
-            ("A", 50, 200),
-            ("B", 300, 350),
-            ("C", 150, 100),
-            ("D", 250, 400),
-            ("E", 400, 300),
-            ("F", 100, 150),
-            ("G", 350, 150),
-            ("H", 200, 250)
-        ]
-        
-        self.cities = sample_cities
+        self.city_names = ["A", "B", "C", "D", "E", "F", "G", "H"]
+        self.city_coords = np.array([
+            [50, 200],
+            [300, 350],
+            [150, 100],
+            [250, 400],
+            [400, 300],
+            [100, 150],
+            [350, 150],
+            [200, 250]
+        ], dtype=np.float64)
+        
+        self.city_name_set = set(self.city_names)
+        self.city_labels = [f"{name} ({x:.1f}, {y:.1f})"
+                            for name, (x, y)
+                            in zip(self.city_names, self.city_coords)]
+
+        # One bulk insert instead of per-item addItem calls: each
+        # addItem emits model signals and relayouts the view, so bulk
+        # loads would otherwise pay O(n) layout passes
+        self.cities_list.setUpdatesEnabled(False)
         self.cities_list.clear()
-        for name, x, y in sample_cities:
-            self.cities_list.addItem(f"{name} ({x:.1f}, {y:.1f})")
-        
-        self.canvas.set_cities(self.cities)
-        self.status_label.setText(f"Status: {len(self.cities)} sample cities loaded")
+        self.cities_list.addItems(self.city_labels)
+        self.cities_list.setUpdatesEnabled(True)
+
+        self.schedule_canvas_refresh()
+        self.status_label.setText(f"Status: {len(self.city_names)} sample cities loaded")
+    
+    def schedule_canvas_refresh(self):
+        """Push the current city set to the canvas on the next tick"""
+        if self._canvas_refresh_scheduled:
+            return
+        self._canvas_refresh_scheduled = True
+        QTimer.singleShot(0, self._do_canvas_refresh)
+    
+    def _do_canvas_refresh(self):
+        self._canvas_refresh_scheduled = False
+        self.canvas.set_cities(self.city_names, self.city_coords)
     
     def start_solving(self):
         """Start solving"""
-        if len(self.cities) < 4:
+        if len(self.city_names) < 4:
             QMessageBox.warning(self, "Insufficient Cities",
                               "Please add at least 4 cities")
             return
@@ -406,11 +466,32 @@ class TwoOptMainWindow(QMainWindow):
         # Get initial method
         method = 'nearest_neighbor' if self.initial_method_combo.currentIndex() == 0 else 'random'
         
-        self.solver_thread = SolverThread(self.cities, method)
-        self.solver_thread.progress_update.connect(self.on_progress_update)
+        # Reuse the distance matrix when re-solving an unchanged city
+        # set (e.g. trying the other initial-tour method)
+        key = self.city_coords.tobytes()
+        distance_matrix = self._dist_cache.get(key)
+        if distance_matrix is None:
+            distance_matrix = pairwise_distance_matrix(self.city_coords)
+            self._dist_cache = {key: distance_matrix}
+        
+        self.solver_thread = SolverThread(self.city_names, self.city_coords,
+                                          method, distance_matrix)
         self.solver_thread.solution_found.connect(self.on_solution_found)
         self.solver_thread.error_occurred.connect(self.on_error)
+        self._last_stats = None
         self.solver_thread.start()
+        self._poll_timer.start()
+    
+    def poll_progress(self):
+        """Sample the solver's latest progress snapshot"""
+        thread = self.solver_thread
+        if thread is None:
+            return
+        stats = thread.latest_stats
+        if stats is None or stats is self._last_stats:
+            return
+        self._last_stats = stats
+        self.on_progress_update(stats)
     
     def on_progress_update(self, stats):
         """Handle progress updates"""
@@ -425,8 +506,9 @@ class TwoOptMainWindow(QMainWindow):
         self.improvements_label.setText(f"Improvements: {improvements}")
         self.distance_label.setText(f"Current Distance: {distance:.2f}")
         
-        # Update canvas
-        if stats.get('tour'):
+        # Update canvas; 'searching' updates carry no tour (it has not
+        # changed), so the canvas keeps its cached polyline
+        if 'tour' in stats:
             self.canvas.set_tour(stats['tour'])
         
         if phase == 'initial':
@@ -451,6 +533,7 @@ class TwoOptMainWindow(QMainWindow):
     
     def on_solution_found(self, tour, distance):
         """Handle solution found"""
+        self._poll_timer.stop()
         self.solution = tour
         self.total_distance = distance
         
@@ -476,11 +559,13 @@ class TwoOptMainWindow(QMainWindow):
     
     def on_error(self, error_msg):
         """Handle error"""
+        self._poll_timer.stop()
         QMessageBox.critical(self, "Error", f"An error occurred: {error_msg}")
         self.reset_all()
     
     def reset_all(self):
         """Reset everything"""
+        self._poll_timer.stop()
         if self.solver_thread and self.solver_thread.isRunning():
             self.solver_thread.stop()
             self.solver_thread.wait()